@@ -0,0 +1,54 @@
+# pylint: disable=invalid-name
+"""
+Ahead-of-time build script for the statistics hot kernels.
+
+Compiles the Welford variance and fused moments kernels into a
+`stats_kernels` shared library with numba.pycc, so one-shot CLI runs of
+computeStatistics.py pay no JIT warm-up cost. Build once per
+environment from this directory:
+
+    python build_kernels.py
+
+computeStatistics.py falls back to the JIT / pure-Python kernels when
+the compiled module is absent.
+"""
+
+from numba.pycc import CC
+
+cc = CC('stats_kernels')
+
+
+@cc.export('var_welford', 'f8(f8[:], i8)')
+def var_welford(data, ddof):
+    """One-pass numerically stable (Welford) variance."""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in data:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return m2 / (n - ddof)
+
+
+@cc.export('moments', 'UniTuple(f8, 4)(f8[:])')
+def moments(a):
+    """Fused mean, biased variance, min and max in one pass."""
+    n = len(a)
+    s = 0.0
+    ss = 0.0
+    lo = a[0]
+    hi = a[0]
+    for i in range(n):
+        x = a[i]
+        s += x
+        ss += x * x
+        lo = min(lo, x)
+        hi = max(hi, x)
+    mean = s / n
+    return mean, ss / n - mean * mean, lo, hi
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -13,120 +13,405 @@ Usage:
     python computeStatistics.py fileWithData.txt
 """
 
+import array
+import logging
+import math
+import os
+import re
 import sys
 import time
+from collections import Counter
+from typing import NamedTuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-class StatisticsData:
-    """Object that stores numbers and computes descriptive statistics.
+# Matches any decimal/scientific-notation literal accepted as a number
+_NUMBER_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
 
-    The object is initialized with the list of numbers and exposes methods
-    to compute mean, median, mode, variance and standard deviation. A
-    convenience method `compute_all()` runs computations in the correct order
-    and stores results as attributes on the instance.
+# Per-record diagnostics go through a logger: a print per bad line
+# means a formatted string and a stdout flush each time, while a
+# silenced or buffered logger defers or skips that work entirely
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    # Ahead-of-time compiled kernels (see build_kernels.py): same loops
+    # as below but without the per-invocation JIT warm-up cost
+    import stats_kernels as _kernels
+except ImportError:
+    _kernels = None
+
+
+def _var_welford(data, ddof=1):
+    """Compute variance in one numerically stable pass (Welford).
+
+    Args:
+        data: Sequence or float64 ndarray of numbers
+        ddof (int): Delta degrees of freedom (1 for sample variance)
+
+    Returns:
+        float: Variance of the data
     """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in data:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return m2 / (n - ddof)
 
-    def __init__(self, numbers):
-        """Initialize with the list of numbers.
-
-        Args:
-            numbers (list): List of numeric values
-        """
-        self.numbers = numbers
-        self.mean = None
-        self.median = None
-        self.modes = None
-        self.variance = None
-        self.std_dev = None
-
-    def calculate_mean(self):
-        """Calculate and store the mean (average)."""
-        self.mean = sum(self.numbers) / len(self.numbers)
-        return self.mean
-
-    def calculate_median(self):
-        """Calculate and store the median."""
-        sorted_nums = sorted(self.numbers)
-        n = len(sorted_nums)
-        if n % 2 == 1:
-            self.median = sorted_nums[n // 2]
-        else:
-            self.median = (sorted_nums[n // 2 - 1] + sorted_nums[n // 2]) / 2
-        return self.median
 
-    def calculate_mode(self):
-        """Calculate and store the mode(s). Returns 'NA' if none."""
-        frequency_dict = {}
-        for num in self.numbers:
-            frequency_dict[num] = frequency_dict.get(num, 0) + 1
+if njit is not None:
+    _var_welford = njit(cache=True)(_var_welford)
+
+
+def _moments(a):
+    """Fuse mean, variance, min and max into one pass over the data.
+
+    With Numba the loop is compiled with prange so the reduction runs
+    multithreaded with SIMD; otherwise it is a plain Python loop.
 
-        max_frequency = max(frequency_dict.values())
-        modes = [num for num, freq in frequency_dict.items() if freq == max_frequency]
+    Args:
+        a: Float64 ndarray of numbers
+
+    Returns:
+        tuple: (mean, biased variance, minimum, maximum)
+    """
+    n = len(a)
+    s = 0.0
+    ss = 0.0
+    lo = a[0]
+    hi = a[0]
+    for i in prange(n):  # pylint: disable=not-an-iterable
+        x = a[i]
+        s += x
+        ss += x * x
+        lo = min(lo, x)
+        hi = max(hi, x)
+    mean = s / n
+    return mean, ss / n - mean * mean, lo, hi
+
+
+if njit is not None:
+    _moments = njit(parallel=True, fastmath=True, cache=True)(_moments)
+
+
+class StatisticsData(NamedTuple):
+    """Immutable container for the computed descriptive statistics.
+
+    A NamedTuple gives C-struct-like slot storage instead of a
+    per-instance dict, so attribute access is an indexed load. Instances
+    are produced by `compute_statistics()`.
+    """
 
+    count: int
+    mean: float
+    median: float
+    modes: object
+    variance: float
+    std_dev: float
+
+
+def calculate_mean(numbers):
+    """Calculate the mean (average) of the numbers."""
+    if np is not None and isinstance(numbers, np.ndarray):
+        return float(numbers.mean())
+    # math.fsum (Shewchuk) gives a correctly rounded sum, unlike the
+    # single-accumulator builtin sum()
+    return math.fsum(numbers) / len(numbers)
+
+
+def calculate_median(numbers):
+    """Calculate the median of the numbers."""
+    if np is not None and isinstance(numbers, np.ndarray):
+        # np.median handles the even/odd branch and the O(n) partition
+        # entirely in C
+        return float(np.median(numbers))
+    n = len(numbers)
+    sorted_nums = sorted(numbers)
+    if n % 2 == 1:
+        return sorted_nums[n // 2]
+    return (sorted_nums[n // 2 - 1] + sorted_nums[n // 2]) / 2
+
+
+def calculate_mode(numbers):
+    """Calculate the mode(s) of the numbers. Returns 'NA' if none."""
+    if np is not None and isinstance(numbers, np.ndarray):
+        # Counting happens in C over sorted runs instead of a
+        # per-element Python dict update
+        vals, first_seen, counts = np.unique(
+            numbers, return_index=True, return_counts=True)
+        max_frequency = counts.max()
+        tied = counts == max_frequency
         # If every value has the same frequency, there is no mode
-        if len(modes) == len(frequency_dict):
-            self.modes = "NA"
+        if int(tied.sum()) == len(vals):
+            return "NA"
+        # np.unique sorts by value; pick the tied mode that occurs
+        # first in the input, matching the Counter path below
+        return [float(vals[tied][first_seen[tied].argmin()])]
+
+    frequency_dict = Counter(numbers)
+    max_frequency = max(frequency_dict.values())
+    modes = [num for num, freq in frequency_dict.items()
+             if freq == max_frequency]
+
+    # If every value has the same frequency, there is no mode
+    if len(modes) == len(frequency_dict):
+        return "NA"
+    # Match previous behavior: return only the first mode in a list
+    return [modes[0]]
+
+
+def calculate_variance(numbers):
+    """Calculate the (sample) variance of the numbers."""
+    if np is not None and isinstance(numbers, np.ndarray):
+        if _kernels is not None:
+            return float(_kernels.var_welford(numbers, 1))
+        if njit is not None:
+            return float(_var_welford(numbers))
+        # Vectorized fallback when no compiled kernel is available
+        return float(np.var(numbers, ddof=1))
+    # One-pass Welford update: numerically stable pure-Python fallback
+    return float(_var_welford(numbers))
+
+
+def compute_statistics(numbers):
+    """Compute all descriptive statistics for the numbers.
+
+    Args:
+        numbers: List or float64 ndarray of numeric values
+
+    Returns:
+        StatisticsData: NamedTuple with all computed statistics
+    """
+    use_kernel = (_kernels is not None or njit is not None)
+    if use_kernel and np is not None and isinstance(numbers, np.ndarray):
+        # Fused kernel: mean and variance in a single pass, AOT-compiled
+        # when available, JIT-compiled otherwise
+        n = len(numbers)
+        if _kernels is not None:
+            mean, var_biased, _, _ = _kernels.moments(numbers)
         else:
-            # Match previous behavior: return only the first mode in a list
-            self.modes = [modes[0]]
-
-        return self.modes
-
-    def calculate_variance(self):
-        """Calculate and store the (sample) variance."""
-        # recompute mean to be safe
-        self.mean = sum(self.numbers) / len(self.numbers)
-        squared_diffs = [(x - self.mean) ** 2 for x in self.numbers]
-        # sample variance (n-1)
-        self.variance = sum(squared_diffs) / (len(self.numbers) - 1)
-        return self.variance
-
-    def calculate_std_deviation(self):
-        """Calculate and store the standard deviation from variance."""
-        if self.variance is None:
-            self.calculate_variance()
-        self.std_dev = self.variance ** 0.5
-        return self.std_dev
-
-    def compute_all(self):
-        """Compute mean, median, mode, variance and std deviation in order."""
-        self.calculate_mean()
-        self.calculate_median()
-        self.calculate_mode()
-        self.calculate_variance()
-        self.calculate_std_deviation()
-        return self
+            mean, var_biased, _, _ = _moments(numbers)
+        mean = float(mean)
+        variance = float(var_biased * n / (n - 1))
+    else:
+        mean = calculate_mean(numbers)
+        variance = calculate_variance(numbers)
+    return StatisticsData(
+        count=len(numbers),
+        mean=mean,
+        median=calculate_median(numbers),
+        modes=calculate_mode(numbers),
+        variance=variance,
+        std_dev=variance ** 0.5,
+    )
 
 
-def read_numbers_from_file(filename):
+# Files larger than this are not materialized in RAM; statistics are
+# computed in a single streaming pass instead
+_STREAM_THRESHOLD = 128 * 1024 * 1024
+
+# Upper bound on distinct values tracked for the streaming mode estimate
+_MODE_TRACK_LIMIT = 65536
+
+
+class _P2Median:
+    """Streaming median estimate via the P-squared algorithm.
+
+    Maintains five markers (Jain & Chlamtac, 1985) updated in O(1) per
+    observation, so the median of an arbitrarily long stream can be
+    estimated without storing the data.
     """
-    Read numbers from a file, handling invalid data gracefully.
+
+    def __init__(self):
+        self._initial = []
+        self._q = None   # marker heights
+        self._n = None   # marker positions
+        self._np = None  # desired marker positions
+        self._dn = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+    def add(self, x):
+        """Feed one observation into the estimator."""
+        if self._q is None:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                self._q = self._initial
+                self._n = [1, 2, 3, 4, 5]
+                self._np = [1.0, 2.0, 3.0, 4.0, 5.0]
+            return
+        q, n = self._q, self._n
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._np[i] += self._dn[i]
+        for i in range(1, 4):
+            diff = self._np[i] - n[i]
+            if (diff >= 1 and n[i + 1] - n[i] > 1) or \
+                    (diff <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if diff > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] += step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i, step):
+        """Piecewise-parabolic (P2) marker height adjustment."""
+        q, n = self._q, self._n
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        """Return the current median estimate."""
+        if self._q is None:
+            # Fewer than five observations: exact median
+            vals = sorted(self._initial)
+            k = len(vals)
+            if k == 0:
+                return 0.0
+            if k % 2 == 1:
+                return vals[k // 2]
+            return (vals[k // 2 - 1] + vals[k // 2]) / 2
+        return self._q[2]
+
+
+def compute_statistics_streaming(filename):
+    """Compute statistics in one pass with bounded memory.
+
+    Uses online algorithms so files larger than RAM (or pipes) can be
+    processed: Welford for mean/variance, the P-squared estimator for
+    the median and a Misra-Gries-capped counter for the mode. Median
+    and mode are close approximations on such streams.
 
     Args:
         filename (str): Path to the file containing numbers
 
     Returns:
-        list: List of valid numbers extracted from the file
+        StatisticsData: NamedTuple with all computed statistics
     """
-    numbers = []
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    median_est = _P2Median()
+    counts = {}
     invalid_count = 0
+    is_number = _NUMBER_RE.fullmatch
 
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
+        with open(filename, 'rb', buffering=1 << 20) as file:
+            for line_num, raw in enumerate(file, 1):
+                text = raw.strip().decode('utf-8', 'replace')
+                if not text or text.startswith('#'):
                     continue
+                if is_number(text):
+                    x = float(text)
+                else:
+                    # The regex is narrower than float() (inf, nan,
+                    # underscore separators), so a miss gets one
+                    # guarded parse attempt before being skipped
+                    try:
+                        x = float(text)
+                    except ValueError:
+                        invalid_count += 1
+                        logger.warning(
+                            "Error: Line %d contains invalid data: "
+                            "'%s' (skipped)", line_num, text)
+                        continue
+                n += 1
+                delta = x - mean
+                mean += delta / n
+                m2 += delta * (x - mean)
+                median_est.add(x)
+                count = counts.get(x)
+                if count is not None:
+                    counts[x] = count + 1
+                elif len(counts) < _MODE_TRACK_LIMIT:
+                    counts[x] = 1
+                else:
+                    # Misra-Gries decrement step keeps memory bounded
+                    for key in list(counts):
+                        counts[key] -= 1
+                        if counts[key] == 0:
+                            del counts[key]
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except IOError as e:
+        print(f"Error: Could not read file '{filename}': {e}")
+        sys.exit(1)
+
+    if invalid_count > 0:
+        logger.warning(
+            "Warning: %d invalid entries were skipped.\n", invalid_count)
+
+    if n == 0:
+        print("Error: No valid numbers found in the file.")
+        sys.exit(1)
+
+    if not counts:
+        # The Misra-Gries decrement step can empty the tracker when
+        # the stream holds more distinct values than the track limit
+        modes = "NA"
+    else:
+        max_frequency = max(counts.values())
+        modes = [num for num, freq in counts.items()
+                 if freq == max_frequency]
+        if len(modes) == len(counts):
+            modes = "NA"
+        else:
+            modes = [modes[0]]
+
+    variance = m2 / (n - 1) if n > 1 else 0.0
+    return StatisticsData(
+        count=n,
+        mean=mean,
+        median=median_est.value(),
+        modes=modes,
+        variance=variance,
+        std_dev=variance ** 0.5,
+    )
 
-                try:
-                    # Try to convert to float
-                    num = float(line)
-                    numbers.append(num)
-                except ValueError:
-                    invalid_count += 1
-                    print(f"Error: Line {line_num} contains invalid data: "
-                          f"'{line}' (skipped)")
 
+def read_numbers_from_file(filename):
+    """
+    Read numbers from a file, handling invalid data gracefully.
+
+    Args:
+        filename (str): Path to the file containing numbers
+
+    Returns:
+        list: List of valid numbers extracted from the file
+        (a NumPy float64 array when NumPy is available)
+    """
+    try:
+        # Binary read with a large buffer: fewer read syscalls and a
+        # single decode instead of per-line text processing
+        with open(filename, 'rb', buffering=1 << 20) as file:
+            lines = file.read().decode('utf-8').splitlines()
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
@@ -134,13 +419,54 @@ def read_numbers_from_file(filename):
         print(f"Error: Could not read file '{filename}': {e}")
         sys.exit(1)
 
+    # Keep (line number, text) pairs so invalid lines can still be reported
+    entries = [(line_num, line.strip())
+               for line_num, line in enumerate(lines, 1)]
+    entries = [(line_num, text) for line_num, text in entries
+               if text and not text.startswith('#')]
+
+    if np is not None and entries:
+        try:
+            # Bulk parse in C: one call instead of one float() per line
+            return np.array([text for _, text in entries], dtype=np.float64)
+        except ValueError:
+            # Some lines are invalid; fall through to the per-entry
+            # parse below so they can be reported and skipped.
+            pass
+
+    # array('d') keeps parsed values in a packed C double buffer instead
+    # of a list of boxed PyFloat objects
+    numbers = array.array('d')
+    invalid_count = 0
+    is_number = _NUMBER_RE.fullmatch
+    for line_num, text in entries:
+        # Pre-validate with a compiled regex: branching is far cheaper
+        # than raising and unwinding a ValueError per bad line
+        if is_number(text):
+            numbers.append(float(text))
+            continue
+        # The regex is narrower than float() (inf, nan, underscore
+        # separators), so a miss gets one guarded parse attempt
+        try:
+            numbers.append(float(text))
+        except ValueError:
+            invalid_count += 1
+            logger.warning(
+                "Error: Line %d contains invalid data: "
+                "'%s' (skipped)", line_num, text)
+
     if invalid_count > 0:
-        print(f"Warning: {invalid_count} invalid entries were skipped.\n")
+        logger.warning(
+            "Warning: %d invalid entries were skipped.\n", invalid_count)
 
     if not numbers:
         print("Error: No valid numbers found in the file.")
         sys.exit(1)
 
+    if np is not None:
+        # array('d') exposes the buffer protocol, so this is a zero-copy
+        # view rather than a per-element conversion
+        return np.frombuffer(numbers, dtype=np.float64)
     return numbers
 
 
@@ -168,7 +494,7 @@ def format_results(filename, stats_data):
         "\n" + "=====================================" + "\n"
         f"DESCRIPTIVE STATISTICS RESULTS for {filename}\n"
         "=====================================" + "\n"
-        f"Number of items: {len(stats_data.numbers)}\n"
+        f"Number of items: {stats_data.count}\n"
         f"Mean: {stats_data.mean:.2f}\n"
         f"Median: {stats_data.median:.2f}\n"
         f"Mode(s): {modes_str}\n"
@@ -191,12 +517,22 @@ def main():
 
     filename = sys.argv[1]
 
-    # Read numbers from file
-    numbers = read_numbers_from_file(filename)
+    # Plain-message console handler so diagnostics read as before;
+    # library users can attach their own handler or silence the logger
+    logging.basicConfig(format='%(message)s')
+
+    # Stream files too large to materialize; otherwise read fully
+    try:
+        file_size = os.path.getsize(filename)
+    except OSError:
+        file_size = 0
 
-    # Create statistics data object and compute all stats
-    stats_data = StatisticsData(numbers)
-    stats_data.compute_all()
+    if file_size > _STREAM_THRESHOLD:
+        stats_data = compute_statistics_streaming(filename)
+    else:
+        numbers = read_numbers_from_file(filename)
+        # Compute all statistics into an immutable result tuple
+        stats_data = compute_statistics(numbers)
 
     # Calculate execution time
     end_time = time.time()
@@ -212,7 +548,9 @@ def main():
 
     # Write to file
     try:
-        with open('./4.2/P1/results/StatisticsResults.txt', 'a', encoding='utf-8') as output_file:
+        # Single buffered open per run: results are flushed once on close
+        with open('./4.2/P1/results/StatisticsResults.txt', 'a',
+                  buffering=1 << 20, encoding='utf-8') as output_file:
             output_file.write(results)
             output_file.write(time_str)
         print("Results saved to '/4.2/P1/results/StatisticsResults.txt'")
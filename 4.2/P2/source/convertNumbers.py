@@ -10,6 +10,59 @@ functions for base conversion).
 import sys
 import time
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_HEX_DIGITS = b'0123456789ABCDEF'
+
+# Byte-value lookup table: each byte (0..255) maps to its 8-bit string,
+# so conversions walk whole bytes instead of single bits
+_BIN_BYTE = [format(i, '08b') for i in range(256)]
+
+# Translation table mapping nibble values 0..15 to their hex characters
+# in one C-level bytes.translate pass
+_HEX_TBL = bytes.maketrans(bytes(range(16)), _HEX_DIGITS)
+
+
+def _vectorized_conversions(numbers):
+    """Convert all numbers to binary/hex strings with NumPy bit ops.
+
+    Extracts every bit/nibble lane in parallel with shift-and-mask over
+    an int64 array, then packs the digit planes into strings, so the
+    whole batch is converted with a handful of C calls.
+
+    Args:
+        numbers (list): Numbers read from the input file
+
+    Returns:
+        tuple: (binary list, hexadecimal list), or None when NumPy is
+        unavailable or the values fall outside the 10-bit input range
+    """
+    if np is None or not numbers:
+        return None
+    # -1024 is excluded: its 10-bit pattern is all zeros, which the
+    # scalar functions render as '' but this path would render as '0'
+    if not all(isinstance(n, int) and -1024 < n < 1024 for n in numbers):
+        return None
+
+    arr = np.asarray(numbers, dtype=np.int64)
+
+    bin_arr = arr & 0x3FF
+    bits = ((bin_arr[:, None] >> np.arange(9, -1, -1)) & 1)
+    bits = bits.astype('u1') + ord('0')
+    binaries = [s.decode('ascii').lstrip('0') or '0'
+                for s in bits.view('S10').ravel()]
+
+    hex_arr = arr & 0xFFFFFFFFFF
+    nibbles = ((hex_arr[:, None] >> np.arange(36, -1, -4)) & 0xF)
+    hex_chars = np.frombuffer(_HEX_DIGITS, dtype='u1')[nibbles]
+    hexadecimals = [s.decode('ascii').lstrip('0') or '0'
+                    for s in hex_chars.view('S10').ravel()]
+
+    return binaries, hexadecimals
+
 
 def read_numbers_from_file(filename):
     """
@@ -64,19 +117,13 @@ def decimal_to_binary(num):
         return "0"
 
     # Handle negative numbers using two's complement (10-bit representation)
+    # num & 0x3FF is equivalent to 1024 + num for the 10-bit range and
+    # matches Excel's DEC.A.BIN behavior
     if num < 0:
-        # Convert to two's complement: 2^10 + num for 10-bit representation
-        # This matches Excel's DEC.A.BIN behavior
-        num = 1024 + num # 1024 = 2^10
-    # Convert positive number to binary
-    binary = ""
-    temp = num
-    while temp > 0:
-        remainder = temp % 2
-        binary = str(remainder) + binary
-        temp = temp // 2
-
-    return binary
+        num &= 0x3FF
+    # Translate one byte (8 bits) per lookup via the precomputed table
+    num_bytes = num.to_bytes((num.bit_length() + 7) // 8, 'big')
+    return ''.join(_BIN_BYTE[b] for b in num_bytes).lstrip('0')
 
 
 def decimal_to_hexadecimal(num):
@@ -95,22 +142,18 @@ def decimal_to_hexadecimal(num):
     if num == 0:
         return "0"
 
-    # Handle negative numbers using two's complement (10-digit hex = 40-bit representation)
+    # Handle negative numbers using two's complement (10-digit hex = 40-bit
+    # representation). num & 0xFFFFFFFFFF is equivalent to 16^10 + num and
+    # matches Excel's DEC.A.HEX behavior
     if num < 0:
-        # Convert to two's complement: 16^10 + num for 10-digit hex representation
-        # This matches Excel's DEC.A.HEX behavior
-        num = 1099511627776 + num # 1099511627776 = 16^10
-    # Convert positive number to hexadecimal
-    hex_chars = "0123456789ABCDEF"
-    hexadecimal = ""
-    temp = num
-
-    while temp > 0:
-        remainder = temp % 16
-        hexadecimal = hex_chars[remainder] + hexadecimal
-        temp = temp // 16
-
-    return hexadecimal
+        num &= 0xFFFFFFFFFF
+    # Split bytes into nibbles, then map all of them to hex characters
+    # with a single C-level translate call
+    num_bytes = num.to_bytes((num.bit_length() + 7) // 8, 'big')
+    nibbles = bytearray(2 * len(num_bytes))
+    nibbles[::2] = bytes(b >> 4 for b in num_bytes)
+    nibbles[1::2] = bytes(b & 0xF for b in num_bytes)
+    return nibbles.translate(_HEX_TBL).decode('ascii').lstrip('0')
 
 
 def process_and_display_conversions(numbers, output_file, filename):
@@ -125,27 +168,36 @@ def process_and_display_conversions(numbers, output_file, filename):
     Returns:
         None
     """
+    lines = ["Decimal | Binary | Hexadecimal", "-" * 40]
+
+    converted = _vectorized_conversions(numbers)
+    if converted is not None:
+        binaries, hexadecimals = converted
+        lines.extend(f"{num:7d} | {binary:>20s} | {hexadecimal:>12s}"
+                     for num, binary, hexadecimal
+                     in zip(numbers, binaries, hexadecimals))
+    else:
+        for num in numbers:
+            try:
+                # Try to convert to binary and hexadecimal
+                binary = decimal_to_binary(num)
+                hexadecimal = decimal_to_hexadecimal(num)
+            except (TypeError, ValueError):
+                # If conversion fails, display NA
+                binary = "NA"
+                hexadecimal = "NA"
+            if isinstance(num, str):
+                lines.append(f"{num:>7s} | {binary:>20s} | "
+                             f"{hexadecimal:>12s}")
+            else:
+                lines.append(f"{num:7d} | {binary:>20s} | "
+                             f"{hexadecimal:>12s}")
+
+    # One write call per stream instead of one per number
+    buf = "\n".join(lines) + "\n"
+    sys.stdout.write(buf)
     output_file.write(f"======= Convert Numbers for {filename} ==========\n")
-    output_file.write("Decimal | Binary | Hexadecimal\n")
-    output_file.write("-" * 40 + "\n")
-    print("Decimal | Binary | Hexadecimal")
-    print("-" * 40)
-
-    for num in numbers:
-        try:
-            # Try to convert to binary and hexadecimal
-            binary = decimal_to_binary(num)
-            hexadecimal = decimal_to_hexadecimal(num)
-        except (TypeError, ValueError):
-            # If conversion fails, display NA
-            binary = "NA"
-            hexadecimal = "NA"
-        if isinstance(num, str):
-            output_line = f"{num:>7s} | {binary:>20s} | {hexadecimal:>12s}"
-        else:
-            output_line = f"{num:7d} | {binary:>20s} | {hexadecimal:>12s}"
-        print(output_line)
-        output_file.write(output_line + "\n")
+    output_file.write(buf)
 
 
 def main():
@@ -168,8 +220,9 @@ def main():
 
     # Open output file for writing
     try:
+        # Large explicit buffer: all output is flushed once on close
         with open("./4.2/P2/results/ConvertionResults.txt", 'a',
-                  encoding='utf-8') as output_file:
+                  buffering=1 << 20, encoding='utf-8') as output_file:
             # Process and display conversions
             process_and_display_conversions(numbers, output_file, filename)
 
@@ -11,6 +11,138 @@ import json
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+
+def _sales_total(ids, qtys, prices):
+    """Accumulate price[id] * qty over all sales."""
+    total = 0.0
+    for i in prange(ids.size):  # pylint: disable=not-an-iterable
+        total += prices[ids[i]] * qtys[i]
+    return total
+
+
+if njit is not None:
+    _sales_total = njit(parallel=True, cache=True)(_sales_total)
+
+
+def _compute_sales_total_compiled(sales_data, price_map):
+    """Sum all sales in a compiled parallel reduction.
+
+    Maps product titles to small integer ids, then hands the
+    price-times-quantity accumulation to the Numba kernel, which LLVM
+    auto-vectorizes and splits across cores. Like the pandas path, it
+    declines whenever a record would need a per-sale warning.
+
+    Args:
+        sales_data (list): List of sale dictionaries from JSON.
+        price_map (dict): Dictionary mapping product titles to prices.
+
+    Returns:
+        tuple: (total_cost, formatted detail lines, 0), or None when
+        NumPy/Numba are unavailable or the data needs diagnostics.
+    """
+    if np is None or njit is None or not sales_data:
+        return None
+
+    id_map = {title: i for i, title in enumerate(price_map)}
+    ids = np.empty(len(sales_data), np.int32)
+    qtys = np.empty(len(sales_data), np.float64)
+    for i, sale in enumerate(sales_data):
+        if not isinstance(sale, dict):
+            return None
+        pid = id_map.get(sale.get('Product'))
+        if pid is None:
+            return None
+        try:
+            qty = float(sale.get('Quantity'))
+        except (ValueError, TypeError):
+            return None
+        if qty < 0:
+            return None
+        ids[i] = pid
+        qtys[i] = qty
+
+    prices = np.fromiter(price_map.values(), np.float64, len(price_map))
+    total_cost = _sales_total(ids, qtys, prices)
+
+    item_costs = prices[ids] * qtys
+    sales_details = [
+        f"{str(sale.get('SALE_ID', 'Unknown')):<12} "
+        f"{str(sale.get('SALE_Date', 'Unknown')):<12} "
+        f"{sale['Product']:<30} {qty:<8.2f} "
+        f"${price:<11.2f} ${item_cost:<11.2f}"
+        for sale, qty, price, item_cost
+        in zip(sales_data, qtys, prices[ids], item_costs)
+    ]
+    return float(total_cost), sales_details, 0
+
+
+def _compute_sales_total_vectorized(sales_data, price_map):
+    """Bulk-price all sales with pandas column operations.
+
+    Maps products to prices and multiplies by quantities as whole
+    columns, so the per-sale work runs in C instead of the Python loop.
+    Only the clean common case is handled here: when any record needs a
+    per-sale warning (missing product, bad or negative quantity), the
+    function declines so the loop path can report it.
+
+    Args:
+        sales_data (list): List of sale dictionaries from JSON.
+        price_map (dict): Dictionary mapping product titles to prices.
+
+    Returns:
+        tuple: (total_cost, formatted detail lines, 0), or None when
+        pandas is unavailable or the data needs per-sale diagnostics.
+    """
+    if pd is None or not sales_data:
+        return None
+    if not all(isinstance(sale, dict) for sale in sales_data):
+        return None
+
+    frame = pd.DataFrame.from_records(sales_data)
+    if 'Product' not in frame or 'Quantity' not in frame:
+        return None
+
+    prices = frame['Product'].map(pd.Series(price_map))
+    quantities = pd.to_numeric(frame['Quantity'], errors='coerce')
+    if prices.isna().any() or quantities.isna().any() \
+            or (quantities < 0).any():
+        return None
+
+    totals = prices * quantities
+    sale_ids = (frame['SALE_ID'] if 'SALE_ID' in frame
+                else ['Unknown'] * len(frame))
+    sale_dates = (frame['SALE_Date'] if 'SALE_Date' in frame
+                  else ['Unknown'] * len(frame))
+    sales_details = [
+        f"{str(sale_id):<12} {str(sale_date):<12} "
+        f"{product:<30} {quantity:<8.2f} "
+        f"${price:<11.2f} ${item_cost:<11.2f}"
+        for sale_id, sale_date, product, quantity, price, item_cost
+        in zip(sale_ids, sale_dates, frame['Product'],
+               quantities, prices, totals)
+    ]
+    return float(totals.sum()), sales_details, 0
+
 
 def load_json_file(file_path):
     """
@@ -27,12 +159,18 @@ def load_json_file(file_path):
         json.JSONDecodeError: If the file is not valid JSON.
     """
     try:
+        if orjson is not None:
+            # orjson parses the raw bytes in C, several times faster
+            # than the stdlib parser on large catalogues
+            with open(file_path, 'rb') as file:
+                return orjson.loads(file.read())
         with open(file_path, 'r', encoding='utf-8') as file:
             return json.load(file)
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
         print(f"Error: Invalid JSON in '{file_path}': {e}")
         return None
 
@@ -51,34 +189,29 @@ def build_price_catalogue(catalogue_data):
     if not catalogue_data:
         return price_map
 
+    # No outer exception frame per record: the dict probes below use
+    # .get and cannot raise, so only the float() coercion needs a guard
     for idx, product in enumerate(catalogue_data):
-        try:
-            if not isinstance(product, dict):
-                print(f"Warning: Product at index {idx} is not a dictionary.")
-                continue
-
-            title = product.get('title')
-            price = product.get('price')
-
-            if title is None:
-                print(f"Warning: Product at index {idx} has no 'title' field.")
-                continue
-
-            if price is None:
-                print(f"Warning: Product '{title}' has no 'price' field.")
-                continue
-
-            try:
-                price_value = float(price)
-                price_map[title] = price_value
-            except (ValueError, TypeError):
-                print(f"Warning: Invalid price '{price}' for '{title}'")
-                continue
-
-        except (KeyError, TypeError, ValueError) as e:
-            print(f"Warning: Error processing product at index {idx}: {e}")
+        if not isinstance(product, dict):
+            print(f"Warning: Product at index {idx} is not a dictionary.")
+            continue
+
+        title = product.get('title')
+        price = product.get('price')
+
+        if title is None:
+            print(f"Warning: Product at index {idx} has no 'title' field.")
             continue
 
+        if price is None:
+            print(f"Warning: Product '{title}' has no 'price' field.")
+            continue
+
+        try:
+            price_map[title] = float(price)
+        except (ValueError, TypeError):
+            print(f"Warning: Invalid price '{price}' for '{title}'")
+
     return price_map
 
 
@@ -91,7 +224,7 @@ def compute_sales_total(sales_data, price_map):
         price_map (dict): Dictionary mapping product titles to prices.
 
     Returns:
-        tuple: (total_cost, sales_details_list, error_count)
+        tuple: (total_cost, formatted detail lines, error_count)
     """
     total_cost = 0.0
     sales_details = []
@@ -100,66 +233,73 @@ def compute_sales_total(sales_data, price_map):
     if not sales_data:
         return total_cost, sales_details, error_count
 
+    # Fast paths when the numeric stack is available and no record
+    # needs a per-sale warning: compiled reduction first, then pandas
+    vectorized = (_compute_sales_total_compiled(sales_data, price_map)
+                  or _compute_sales_total_vectorized(sales_data, price_map))
+    if vectorized is not None:
+        return vectorized
+
+    # Pre-bound methods: skip the attribute lookups on every iteration
+    price_map_get = price_map.get
+    details_append = sales_details.append
+
+    # No outer exception frame per record: all field access goes through
+    # .get, so only the float() coercion below can raise
     for idx, sale in enumerate(sales_data):
+        if not isinstance(sale, dict):
+            print(f"Warning: Sale at index {idx} is not a dictionary.")
+            error_count += 1
+            continue
+
+        product = sale.get('Product')
+        quantity = sale.get('Quantity')
+        sale_id = sale.get('SALE_ID', 'Unknown')
+        sale_date = sale.get('SALE_Date', 'Unknown')
+
+        if product is None:
+            print(f"Warning: Sale at index {idx} has no 'Product' field.")
+            error_count += 1
+            continue
+
+        if quantity is None:
+            print(f"Warning: Sale {sale_id} for product '{product}' "
+                  f"has no 'Quantity' field.")
+            error_count += 1
+            continue
+
+        # Single hash lookup instead of a membership test followed
+        # by a separate indexing of the same key
+        price = price_map_get(product)
+        if price is None:
+            print(f"Warning: Product '{product}' (Sale {sale_id}, "
+                  f"Date {sale_date}) not found in price catalogue.")
+            error_count += 1
+            continue
+
         try:
-            if not isinstance(sale, dict):
-                print(f"Warning: Sale at index {idx} is not a dictionary.")
-                error_count += 1
-                continue
-
-            product = sale.get('Product')
-            quantity = sale.get('Quantity')
-            sale_id = sale.get('SALE_ID', 'Unknown')
-            sale_date = sale.get('SALE_Date', 'Unknown')
-
-            if product is None:
-                print(f"Warning: Sale at index {idx} has no 'Product' field.")
-                error_count += 1
-                continue
-
-            if quantity is None:
-                print(f"Warning: Sale {sale_id} for product '{product}' "
-                      f"has no 'Quantity' field.")
-                error_count += 1
-                continue
-
-            if product not in price_map:
-                print(f"Warning: Product '{product}' (Sale {sale_id}, "
-                      f"Date {sale_date}) not found in price catalogue.")
-                error_count += 1
-                continue
-
-            try:
-                qty_value = float(quantity)
-                if qty_value < 0:
-                    print(f"Warning: Negative quantity {qty_value} for "
-                          f"product '{product}' (Sale {sale_id}).")
-                    # Allow negative quantities to subtract from total_cost
-
-                price = price_map[product]
-                item_cost = price * qty_value
-                total_cost += item_cost
-
-                sales_details.append({
-                    'sale_id': sale_id,
-                    'date': sale_date,
-                    'product': product,
-                    'quantity': qty_value,
-                    'unit_price': price,
-                    'total': item_cost
-                })
-
-            except (ValueError, TypeError):
-                print(f"Warning: Invalid quantity '{quantity}' for product "
-                      f"'{product}' (Sale {sale_id}).")
-                error_count += 1
-                continue
-
-        except (KeyError, TypeError, ValueError) as e:
-            print(f"Warning: Error processing sale at index {idx}: {e}")
+            qty_value = float(quantity)
+        except (ValueError, TypeError):
+            print(f"Warning: Invalid quantity '{quantity}' for product "
+                  f"'{product}' (Sale {sale_id}).")
             error_count += 1
             continue
 
+        if qty_value < 0:
+            print(f"Warning: Negative quantity {qty_value} for "
+                  f"product '{product}' (Sale {sale_id}).")
+            # Allow negative quantities to subtract from total_cost
+
+        item_cost = price * qty_value
+        total_cost += item_cost
+
+        # Format the report row immediately: the intermediate
+        # per-sale dict never exists
+        details_append(
+            f"{str(sale_id):<12} {str(sale_date):<12} "
+            f"{product:<30} {qty_value:<8.2f} "
+            f"${price:<11.2f} ${item_cost:<11.2f}")
+
     return total_cost, sales_details, error_count
 
 
@@ -174,7 +314,7 @@ def format_results(
 
     Args:
         total_cost (float): Total cost of all sales.
-        sales_details (list): List of detailed sale information.
+        sales_details (list): Preformatted report lines, one per sale.
         execution_time (float): Time elapsed for execution in seconds.
         error_count (int): Number of errors encountered.
 
@@ -193,10 +333,7 @@ def format_results(
                  f"{'Qty':<8} {'Unit Price':<12} {'Total':<12}")
     lines.append("-" * 70)
 
-    for sale in sales_details:
-        lines.append(f"{str(sale['sale_id']):<12} {str(sale['date']):<12} "
-                     f"{sale['product']:<30} {sale['quantity']:<8.2f} "
-                     f"${sale['unit_price']:<11.2f} ${sale['total']:<11.2f}")
+    lines.extend(sales_details)
 
     lines.append("-" * 70)
     lines.append("")
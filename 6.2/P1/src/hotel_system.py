@@ -1,87 +1,199 @@
 # pylint: disable=too-many-arguments, too-many-positional-arguments
 """Hotel Management System - Classes for Hotel, Customer, and Reservation."""
 
+import re
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any
-from abc import ABC, abstractmethod
+from enum import IntEnum
+from functools import lru_cache
+from typing import Optional, Dict, Any, Protocol
+
+
+class ReservationStatus(IntEnum):
+    """Reservation lifecycle states.
+
+    Stored as small ints so status comparisons on the hot query paths
+    are single integer compares; the string form only exists at the
+    serialization boundary.
+    """
+
+    ACTIVE = 1
+    CANCELLED = 2
+
+
+_STATUS_BY_NAME = {'active': ReservationStatus.ACTIVE,
+                   'cancelled': ReservationStatus.CANCELLED}
+_STATUS_NAMES = {ReservationStatus.ACTIVE: 'active',
+                 ReservationStatus.CANCELLED: 'cancelled'}
+
+# Compiled once at import: validation runs on every customer save/load
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+# The field checks below are pure functions of the field values, so
+# their results are memoized: re-validating an unchanged record (as
+# every save and validate-on-read pass does) becomes one cache probe.
+# Each helper takes a leading tuple of the argument types: lru_cache
+# keys by equality and 1 == 1.0 == True, so without it equal values of
+# different types would share one cache slot despite the
+# isinstance-based checks. Unhashable field values raise TypeError at
+# the call sites, which treat that as invalid data.
+
+def _types_of(*values):
+    """Return the concrete types of `values` for use in cache keys."""
+    return tuple(type(value) for value in values)
+
+
+@lru_cache(maxsize=8192)
+def _hotel_fields_valid(_types, hotel_id, name, location, total_rooms,
+                        rooms_available, price_per_room):
+    """Check hotel field types and value ranges."""
+    return bool(
+        hotel_id and isinstance(hotel_id, str)
+        and name and isinstance(name, str)
+        and location and isinstance(location, str)
+        and isinstance(total_rooms, int)
+        and total_rooms > 0
+        and isinstance(rooms_available, int)
+        and 0 <= rooms_available <= total_rooms
+        and isinstance(price_per_room, (int, float))
+        and price_per_room >= 0
+    )
+
+
+@lru_cache(maxsize=8192)
+def _customer_fields_valid(_types, customer_id, name, email, phone):
+    """Check customer field types, presence, and email shape."""
+    if not customer_id or not isinstance(customer_id, str):
+        return False
+    if not name or not isinstance(name, str):
+        return False
+    if not email or not isinstance(email, str):
+        return False
+    if _EMAIL_RE.match(email) is None:
+        return False
+    if not phone or not isinstance(phone, str):
+        return False
+    return True
+
+
+@lru_cache(maxsize=8192)
+def _reservation_fields_valid(_types, reservation_id, customer_id,
+                              hotel_id, check_in, check_out, status):
+    """Check reservation field types, presence, and status value."""
+    return bool(
+        reservation_id and isinstance(reservation_id, str)
+        and customer_id and isinstance(customer_id, str)
+        and hotel_id and isinstance(hotel_id, str)
+        and check_in and isinstance(check_in, str)
+        and check_out and isinstance(check_out, str)
+        and status in _STATUS_NAMES
+    )
+
+
+# Mutable per-second memo for _current_timestamp, not constants
+_stamp_second = -1  # pylint: disable=invalid-name
+_stamp_value = ''  # pylint: disable=invalid-name
+
+
+def _current_timestamp() -> str:
+    """Return the current ISO timestamp, memoized per second.
 
+    Bulk entity creation stamps many objects in the same second; the
+    throttle makes all but the first of those a dict-free string reuse
+    instead of a datetime construction plus isoformat().
+    """
+    global _stamp_second, _stamp_value  # pylint: disable=global-statement
+    second = int(time.time())
+    if second != _stamp_second:
+        _stamp_second = second
+        _stamp_value = datetime.now().isoformat(timespec='seconds')
+    return _stamp_value
 
-class BaseEntity(ABC):
-    """Abstract base class for entities."""
 
-    @abstractmethod
+class BaseEntity(Protocol):
+    """Structural base for entities.
+
+    A Protocol instead of an ABC: conformance is checked by type
+    checkers, so entity instantiation never routes through the ABCMeta
+    machinery.
+    """
+
+    # Empty slots so subclasses with __slots__ stay __dict__-free
+    __slots__ = ()
+
+    @property
+    def created_date(self) -> str:
+        """Creation timestamp, stamped on first access.
+
+        Lazily computed so entities rebuilt from persisted data never
+        pay for a `datetime.now()` call they immediately discard.
+        """
+        # Every conforming subclass declares the _created_date slot; a
+        # Protocol base cannot, so the slot checks are silenced here.
+        # pylint: disable=assigning-non-slot, access-member-before-definition
+        if self._created_date is None:
+            self._created_date = _current_timestamp()
+        return self._created_date
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert entity to dictionary."""
+        ...
 
-    @abstractmethod
     def validate(self) -> bool:
         """Validate entity data."""
+        ...
 
 
+@dataclass(slots=True, eq=False)
 class Hotel(BaseEntity):
-    """Hotel class representing a hotel with rooms and reservations."""
-    def __init__(self,
-                 hotel_id: str,
-                 name: str,
-                 location: str,
-                 total_rooms: int,
-                 rooms_available: Optional[int] = None,
-                 price_per_room: float = 0.0):
-        """Initialize a Hotel instance.
-
-        Args:
-            hotel_id: Unique hotel identifier.
-            name: Human-readable hotel name.
-            location: Hotel location string.
-            total_rooms: Total number of rooms in the hotel.
-            rooms_available: Number of rooms currently available; if None,
-                defaults to `total_rooms`.
-            price_per_room: Nightly price per room.
-        """
-        self.hotel_id = hotel_id
-        self.name = name
-        self.location = location
-        self.total_rooms = total_rooms
-        self.rooms_available = (
-            rooms_available
-            if rooms_available is not None
-            else total_rooms
-        )
-        self.price_per_room = price_per_room
-        self.created_date = datetime.now().isoformat()
-
-    def _validate_string_field(self, _: str, value: Any) -> bool:
-        """Validate that a field is a non-empty string."""
-        return bool(value and isinstance(value, str))
-
-    def _validate_room_counts(self) -> bool:
-        """Validate room count consistency."""
-        rooms_valid = (isinstance(self.total_rooms, int)
-                       and self.total_rooms > 0
-                       and isinstance(self.rooms_available, int)
-                       and self.rooms_available >= 0)
-        return rooms_valid and self.rooms_available <= self.total_rooms
-
-    def _validate_price(self) -> bool:
-        """Validate price field."""
-        return (
-            isinstance(self.price_per_room, (int, float))
-            and self.price_per_room >= 0
-        )
+    """Hotel class representing a hotel with rooms and reservations.
+
+    Attributes:
+        hotel_id: Unique hotel identifier.
+        name: Human-readable hotel name.
+        location: Hotel location string.
+        total_rooms: Total number of rooms in the hotel.
+        rooms_available: Number of rooms currently available; if None,
+            defaults to `total_rooms`.
+        price_per_room: Nightly price per room.
+    """
+
+    hotel_id: str
+    name: str
+    location: str
+    total_rooms: int
+    rooms_available: Optional[int] = None
+    price_per_room: float = 0.0
+    _created_date: Optional[str] = field(default=None, init=False,
+                                         repr=False)
+
+    def __post_init__(self) -> None:
+        """Default `rooms_available` to the full room count."""
+        if self.rooms_available is None:
+            self.rooms_available = self.total_rooms
 
     def validate(self) -> bool:
         """Validate hotel data fields.
 
         Returns True when all required fields have acceptable types and
-        values; otherwise returns False.
+        values; otherwise returns False. The checks live in a memoized
+        module-level helper, so re-validating an unchanged hotel is a
+        single cache probe.
         """
-        return (
-            self._validate_string_field('hotel_id', self.hotel_id)
-            and self._validate_string_field('name', self.name)
-            and self._validate_string_field('location', self.location)
-            and self._validate_room_counts()
-            and self._validate_price()
-        )
+        try:
+            return _hotel_fields_valid(
+                _types_of(self.hotel_id, self.name, self.location,
+                          self.total_rooms, self.rooms_available,
+                          self.price_per_room),
+                self.hotel_id, self.name, self.location,
+                self.total_rooms, self.rooms_available,
+                self.price_per_room)
+        except TypeError:
+            # An unhashable field value is never a valid field value
+            return False
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the Hotel to a JSON-serializable dict."""
@@ -97,15 +209,22 @@ class Hotel(BaseEntity):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Hotel':
-        """Create a `Hotel` instance from a dictionary (JSON)."""
-        return cls(
-            hotel_id=data['hotel_id'],
-            name=data['name'],
-            location=data['location'],
-            total_rooms=data['total_rooms'],
-            rooms_available=data.get('rooms_available', data['total_rooms']),
-            price_per_room=data.get('price_per_room', 0.0),
-        )
+        """Create a `Hotel` instance from a dictionary (JSON).
+
+        Bypasses `__init__`: attributes are assigned directly on a bare
+        instance, skipping keyword binding for bulk loads.
+        """
+        hotel = cls.__new__(cls)
+        get = data.__getitem__
+        hotel.hotel_id = get('hotel_id')
+        hotel.name = get('name')
+        hotel.location = get('location')
+        hotel.total_rooms = get('total_rooms')
+        hotel.rooms_available = data.get('rooms_available')
+        hotel.price_per_room = data.get('price_per_room', 0.0)
+        hotel._created_date = data.get('created_date')
+        hotel.__post_init__()
+        return hotel
 
     def update(self, name: Optional[str] = None,
                location: Optional[str] = None,
@@ -170,39 +289,38 @@ class Hotel(BaseEntity):
         return self.hotel_id == other.hotel_id
 
 
+@dataclass(slots=True, eq=False)
 class Customer(BaseEntity):
-    """Customer class representing a hotel customer."""
-    def __init__(self, customer_id: str, name: str, email: str, phone: str):
-        """Initialize a Customer instance.
-
-        Args:
-            customer_id: Unique customer identifier.
-            name: Customer full name.
-            email: Customer email address.
-            phone: Customer phone number.
-        """
-        self.customer_id = customer_id
-        self.name = name
-        self.email = email
-        self.phone = phone
-        self.created_date = datetime.now().isoformat()
+    """Customer class representing a hotel customer.
+
+    Attributes:
+        customer_id: Unique customer identifier.
+        name: Customer full name.
+        email: Customer email address.
+        phone: Customer phone number.
+    """
+
+    customer_id: str
+    name: str
+    email: str
+    phone: str
+    _created_date: Optional[str] = field(default=None, init=False,
+                                         repr=False)
 
     def validate(self) -> bool:
         """Validate customer data fields.
 
         Returns True when all required fields are present and valid.
+        The memoized helper also caches the email regex match for
+        records seen before.
         """
-        if not self.customer_id or not isinstance(self.customer_id, str):
-            return False
-        if not self.name or not isinstance(self.name, str):
-            return False
-        if not self.email or not isinstance(self.email, str):
-            return False
-        if '@' not in self.email:
-            return False
-        if not self.phone or not isinstance(self.phone, str):
+        try:
+            return _customer_fields_valid(
+                _types_of(self.customer_id, self.name, self.email,
+                          self.phone),
+                self.customer_id, self.name, self.email, self.phone)
+        except TypeError:
             return False
-        return True
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the Customer to a JSON-serializable dict."""
@@ -220,12 +338,14 @@ class Customer(BaseEntity):
 
         This is typically used when loading from persisted JSON data.
         """
-        return cls(
-            customer_id=data['customer_id'],
-            name=data['name'],
-            email=data['email'],
-            phone=data['phone'],
-        )
+        customer = cls.__new__(cls)
+        get = data.__getitem__
+        customer.customer_id = get('customer_id')
+        customer.name = get('name')
+        customer.email = get('email')
+        customer.phone = get('phone')
+        customer._created_date = data.get('created_date')
+        return customer
 
     def update(self, name: Optional[str] = None,
                email: Optional[str] = None,
@@ -256,60 +376,67 @@ class Customer(BaseEntity):
         return self.customer_id == other.customer_id
 
 
+@dataclass(slots=True, eq=False)
 class Reservation(BaseEntity):
-    """Reservation class representing a hotel reservation."""
-    def __init__(self,
-                 reservation_id: str,
-                 customer_id: str,
-                 hotel_id: str,
-                 check_in: str,
-                 check_out: str,
-                 status: str = "active"):
-        """Initialize a Reservation instance.
-
-        Args:
-            reservation_id: Unique reservation identifier.
-            customer_id: ID of the customer who made the reservation.
-            hotel_id: ID of the hotel reserved.
-            check_in: ISO-format check-in date string.
-            check_out: ISO-format check-out date string.
-            status: Reservation status ("active" or "cancelled").
-        """
-        self.reservation_id = reservation_id
-        self.customer_id = customer_id
-        self.hotel_id = hotel_id
-        self.check_in = check_in
-        self.check_out = check_out
-        self.status = status
-        self.created_date = datetime.now().isoformat()
-
-    def _validate_string_fields(self) -> bool:
-        """Validate all required string fields."""
-        return all([
-            bool(self.reservation_id and isinstance(self.reservation_id, str)),
-            bool(self.customer_id and isinstance(self.customer_id, str)),
-            bool(self.hotel_id and isinstance(self.hotel_id, str)),
-            bool(self.check_in and isinstance(self.check_in, str)),
-            bool(self.check_out and isinstance(self.check_out, str)),
-        ])
+    """Reservation class representing a hotel reservation.
+
+    Attributes:
+        reservation_id: Unique reservation identifier.
+        customer_id: ID of the customer who made the reservation.
+        hotel_id: ID of the hotel reserved.
+        check_in: ISO-format check-in date string.
+        check_out: ISO-format check-out date string.
+        status: Reservation status ("active" or "cancelled").
+    """
+
+    reservation_id: str
+    customer_id: str
+    hotel_id: str
+    check_in: str
+    check_out: str
+    status: str = "active"
+    _created_date: Optional[str] = field(default=None, init=False,
+                                         repr=False)
+    _check_in_dt: Optional[datetime] = field(default=None, init=False,
+                                             repr=False)
+    _check_out_dt: Optional[datetime] = field(default=None, init=False,
+                                              repr=False)
+
+    def __post_init__(self) -> None:
+        """Normalize status and parse the date strings once."""
+        if isinstance(self.status, str):
+            self.status = _STATUS_BY_NAME.get(self.status, 0)
+        try:
+            self._check_in_dt = datetime.fromisoformat(self.check_in)
+            self._check_out_dt = datetime.fromisoformat(self.check_out)
+        except (TypeError, ValueError):
+            self._check_in_dt = None
+            self._check_out_dt = None
 
     def _validate_dates(self) -> bool:
-        """Validate date format and ordering."""
-        try:
-            check_in_date = datetime.fromisoformat(self.check_in)
-            check_out_date = datetime.fromisoformat(self.check_out)
-            return check_in_date < check_out_date
-        except ValueError:
-            return False
+        """Validate date format and ordering against the cached parses."""
+        return (self._check_in_dt is not None
+                and self._check_out_dt is not None
+                and self._check_in_dt < self._check_out_dt)
 
     def validate(self) -> bool:
         """Validate reservation fields and date ordering.
 
         Ensures required fields are strings and that `check_in` < `check_out`.
+        The field-shape checks are memoized; the date ordering uses the
+        datetimes already parsed in `__post_init__`, so it stays outside
+        the cache.
         """
-        return (self._validate_string_fields() and
-                self.status in ["active", "cancelled"] and
-                self._validate_dates())
+        try:
+            fields_ok = _reservation_fields_valid(
+                _types_of(self.reservation_id, self.customer_id,
+                          self.hotel_id, self.check_in, self.check_out,
+                          self.status),
+                self.reservation_id, self.customer_id, self.hotel_id,
+                self.check_in, self.check_out, self.status)
+        except TypeError:
+            return False
+        return fields_ok and self._validate_dates()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the Reservation to a JSON-serializable dict."""
@@ -319,7 +446,7 @@ class Reservation(BaseEntity):
             'hotel_id': self.hotel_id,
             'check_in': self.check_in,
             'check_out': self.check_out,
-            'status': self.status,
+            'status': _STATUS_NAMES.get(self.status, str(self.status)),
             'created_date': self.created_date,
         }
 
@@ -329,22 +456,29 @@ class Reservation(BaseEntity):
 
         Used when loading reservations from persisted JSON.
         """
-        return cls(
-            reservation_id=data['reservation_id'],
-            customer_id=data['customer_id'],
-            hotel_id=data['hotel_id'],
-            check_in=data['check_in'],
-            check_out=data['check_out'],
-            status=data.get('status', 'active'),
-        )
+        reservation = cls.__new__(cls)
+        get = data.__getitem__
+        reservation.reservation_id = get('reservation_id')
+        # hotel/customer IDs and status repeat across many records;
+        # interning dedupes the strings and makes equality checks and
+        # index probes pointer comparisons
+        reservation.customer_id = sys.intern(get('customer_id'))
+        reservation.hotel_id = sys.intern(get('hotel_id'))
+        reservation.check_in = get('check_in')
+        reservation.check_out = get('check_out')
+        reservation.status = _STATUS_BY_NAME.get(
+            data.get('status', 'active'), 0)
+        reservation._created_date = data.get('created_date')
+        reservation.__post_init__()
+        return reservation
 
     def cancel(self) -> bool:
         """Mark the reservation as cancelled if it is currently active.
 
         Returns True when status changed; otherwise False.
         """
-        if self.status == "active":
-            self.status = "cancelled"
+        if self.status == ReservationStatus.ACTIVE:
+            self.status = ReservationStatus.CANCELLED
             return True
         return False
 
@@ -354,7 +488,7 @@ class Reservation(BaseEntity):
             f"Reservation(ID: {self.reservation_id}, "
             f"Customer: {self.customer_id}, Hotel: {self.hotel_id}, "
             f"Check-in: {self.check_in}, Check-out: {self.check_out}, "
-            f"Status: {self.status})"
+            f"Status: {_STATUS_NAMES.get(self.status, self.status)})"
         )
 
     def __eq__(self, other: object) -> bool:
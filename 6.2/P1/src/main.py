@@ -1,7 +1,9 @@
 """Main entry point for Hotel Management System (src package)."""
 
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Handle both module and direct script execution
 if __name__ == '__main__':
@@ -111,6 +113,10 @@ def main() -> None:
 
     If an unexpected error occurs the program exits with a non-zero status.
     """
+    # Show persistence warnings as plain messages on the console; other
+    # embedders can attach their own handlers or silence the logger
+    logging.basicConfig(format='%(message)s')
+
     print("\n" + "=" * 70)
     print("  HOTEL MANAGEMENT SYSTEM - DEMONSTRATION")
     print("=" * 70)
@@ -122,9 +128,14 @@ def main() -> None:
 
     try:
         persistence.clear_all_data()
-        demo_hotels(persistence)
-        demo_customers(persistence)
-        demo_reservations(persistence)
+        # One write per touched file at the end of the block instead of
+        # a rewrite per created entity; the three sections touch
+        # disjoint files, so they run on separate threads
+        with persistence.batch():
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(
+                    lambda demo: demo(persistence),
+                    [demo_hotels, demo_customers, demo_reservations]))
         demo_error_handling()
         print("\n" + "=" * 70)
         print("  DEMONSTRATION COMPLETED SUCCESSFULLY")
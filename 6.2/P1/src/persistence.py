@@ -1,8 +1,28 @@
 """Persistence layer for Hotel Management System (src package)."""
 
 import json
+import logging
 import os
-from typing import List, Optional, Dict, Any
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from typing import Iterator, List, Optional, Dict, Any, Type
 
 # Handle both module and direct import
 try:
@@ -10,15 +30,62 @@ try:
 except ImportError:
     from hotel_system import Hotel, Customer, Reservation
 
+logger = logging.getLogger(__name__)
 
-class DataPersistence:
-    """Handles persistent storage of hotels, customers, and reservations."""
 
-    def __init__(self, data_dir: Optional[str] = None):
+class _EntityTable:
+    """Per-entity wiring for the generic CRUD paths."""
+
+    __slots__ = ('cls', 'label', 'file_path', 'journal_path', 'id_field',
+                 'lock', 'index', 'dirty', 'obj_cache')
+
+    def __init__(self, cls: Type, label: str, file_path: str,
+                 id_field: str):
+        self.cls = cls
+        self.label = label
+        self.file_path = file_path
+        # Mutations append one line here; the snapshot file is only
+        # rewritten on compaction
+        self.journal_path = os.path.splitext(file_path)[0] + '.jsonl'
+        self.id_field = id_field
+        # Reentrant per-file lock: concurrent writers to different
+        # entity kinds never contend, same-kind mutations serialize
+        self.lock = threading.RLock()
+        # Loaded lazily: a cold single-record lookup can stream the
+        # file instead of materializing every record first
+        self.index: Optional[Dict[str, Dict[str, Any]]] = None
+        self.dirty = False
+        # Entities constructed by the last get-all call; invalidated by
+        # any mutation so repeated reads skip N from_dict calls
+        self.obj_cache: Optional[List[Any]] = None
+
+
+class DataPersistence:
+    """Handles persistent storage of hotels, customers, and reservations.
+
+    Each entity file is parsed once into an in-memory dict keyed by
+    entity ID, so lookups and uniqueness checks are O(1) instead of a
+    full-file parse plus linear scan per operation. Mutations append
+    one line to a per-entity JSONL journal — O(1) amortized instead of
+    a full snapshot rewrite — and the journal is replayed over the
+    snapshot on load and folded back in by compact()/flush() or on
+    context-manager exit. All three entity kinds share one generic
+    CRUD implementation dispatched through a per-entity config table;
+    the public per-entity methods are thin wrappers.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None,
+                 validate_on_read: bool = False,
+                 pretty: bool = False):
         """
         Initialize persistence layer.
 
         If `data_dir` is None, use the project's `output/` directory.
+        `validate_on_read` re-runs entity validation in the get_all_*
+        reads; it defaults to False because create/update already
+        reject invalid data, making read-side validation redundant.
+        `pretty` indents the JSON files for human inspection; compact
+        output is the default since only this program reads them.
         """
         if data_dir is None:
             base = os.path.abspath(
@@ -26,6 +93,8 @@ class DataPersistence:
             data_dir = os.path.join(base, 'output')
 
         self.data_dir = data_dir
+        self.validate_on_read = validate_on_read
+        self.pretty = pretty
         self.hotels_file = os.path.join(self.data_dir, "hotels.json")
         self.customers_file = os.path.join(
             self.data_dir, "customers.json")
@@ -35,10 +104,26 @@ class DataPersistence:
         self._ensure_directory()
         self._ensure_files()
 
+        self._batch = False
+        # Parsed snapshot cache keyed by path: (st_mtime_ns, records)
+        self._read_cache: Dict[str, Any] = {}
+        # Secondary reservation indexes; rebuilt from stored data when
+        # the reservations index first loads
+        self._by_hotel: Dict[str, List[str]] = defaultdict(list)
+        self._by_customer: Dict[str, List[str]] = defaultdict(list)
+        self._tables = {
+            'hotels': _EntityTable(
+                Hotel, 'Hotel', self.hotels_file, 'hotel_id'),
+            'customers': _EntityTable(
+                Customer, 'Customer', self.customers_file, 'customer_id'),
+            'reservations': _EntityTable(
+                Reservation, 'Reservation', self.reservations_file,
+                'reservation_id'),
+        }
+
     def _ensure_directory(self) -> None:
         """Ensure that the data directory exists, creating it if necessary."""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
     def _ensure_files(self) -> None:
         """Create empty JSON files for hotels, customers and reservations.
@@ -49,306 +134,548 @@ class DataPersistence:
                 self.hotels_file,
                 self.customers_file,
                 self.reservations_file]:
-            if not os.path.exists(file_path):
-                self._write_json_file(file_path, [])
+            try:
+                # Exclusive create: one syscall replaces the separate
+                # exists-check-then-open pair and is race-free
+                with open(file_path, 'xb') as f:
+                    f.write(b'[]')
+            except FileExistsError:
+                pass
+
+    def _load_index(
+            self,
+            file_path: str,
+            id_field: str) -> Dict[str, Dict[str, Any]]:
+        """Parse a JSON file once into a dict keyed by entity ID."""
+        return {
+            record.get(id_field): record
+            for record in self._read_json_file(file_path)
+            if isinstance(record, dict)
+        }
+
+    def _index(self, kind: str) -> Dict[str, Dict[str, Any]]:
+        """Load an entity index on first use.
+
+        Loads the snapshot file, then replays any pending journal
+        entries on top of it so mutations appended since the last
+        compaction are not lost.
+        """
+        table = self._tables[kind]
+        with table.lock:
+            if table.index is None:
+                table.index = self._load_index(
+                    table.file_path, table.id_field)
+                self._replay_journal(table, table.index)
+                if kind == 'reservations':
+                    self._build_reservation_indexes(table.index)
+            return table.index
+
+    def _replay_journal(
+            self,
+            table: _EntityTable,
+            index: Dict[str, Dict[str, Any]]) -> None:
+        """Apply journalled mutations to a freshly loaded index."""
+        if not os.path.exists(table.journal_path):
+            return
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            with open(table.journal_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = loads(line)
+                    if entry.get('op') == 'del':
+                        index.pop(entry.get('id'), None)
+                    else:
+                        index[entry.get('id')] = entry.get('data')
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Error reading %s: %s", table.journal_path, e)
+
+    def _append_journal(
+            self,
+            kind: str,
+            op: str,
+            entity_id: str,
+            data: Optional[Dict[str, Any]] = None) -> bool:
+        """Append one mutation to an entity's journal file.
+
+        An append is O(1) in the stored record count, so mutations no
+        longer pay a full snapshot rewrite; the snapshot catches up on
+        the next compaction. In batch mode the index is simply marked
+        dirty and written wholesale when the batch ends.
+        """
+        table = self._tables[kind]
+        if self._batch:
+            table.dirty = True
+            return True
+        entry = {'op': op, 'id': entity_id, 'data': data}
+        try:
+            if orjson is not None:
+                line = orjson.dumps(entry) + b'\n'
+            else:
+                line = (json.dumps(entry, separators=(',', ':'))
+                        + '\n').encode('utf-8')
+            with open(table.journal_path, 'ab') as f:
+                f.write(line)
+            return True
+        except (TypeError, ValueError, OSError) as e:
+            logger.warning(
+                "Error writing %s: %s", table.journal_path, e)
+            return False
+
+    def _stream_find(
+            self,
+            file_path: str,
+            id_field: str,
+            entity_id: str) -> Optional[Dict[str, Any]]:
+        """Stream a JSON file and return the first matching record.
+
+        Used for cold lookups when ijson is available: the parse stops
+        at the first match instead of materializing the whole file.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                # use_float keeps streamed numerics as floats, matching
+                # the records the warm orjson/json path produces
+                for record in ijson.items(f, 'item', use_float=True):
+                    if record.get(id_field) == entity_id:
+                        return record
+        except (OSError, ValueError, ijson.JSONError) as e:
+            logger.warning("Error reading %s: %s", file_path, e)
+        return None
+
+    def _build_reservation_indexes(
+            self, reservations: Dict[str, Dict[str, Any]]) -> None:
+        """Build hotel-ID and customer-ID secondary reservation indexes.
+
+        The by-hotel/by-customer queries then touch only their matching
+        reservation IDs instead of scanning every record.
+        """
+        self._by_hotel: Dict[str, List[str]] = defaultdict(list)
+        self._by_customer: Dict[str, List[str]] = defaultdict(list)
+        for res_id, res_data in reservations.items():
+            self._by_hotel[res_data.get('hotel_id')].append(res_id)
+            self._by_customer[res_data.get('customer_id')].append(res_id)
 
     def _read_json_file(self, file_path: str) -> List[Dict[str, Any]]:
         """Read and return list data from a JSON file.
 
         Returns an empty list on JSON errors or if the file is missing.
+        An unchanged file (by st_mtime_ns) is served from the parse
+        cache instead of being re-read and re-parsed.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
+            mtime = os.stat(file_path).st_mtime_ns
+            cached = self._read_cache.get(file_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            if orjson is not None:
+                # orjson parses the raw bytes in C, well ahead of the
+                # stdlib parser
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            data = data if isinstance(data, list) else []
+            self._read_cache[file_path] = (mtime, data)
+            return data
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"Error reading {file_path}: {str(e)}")
+            logger.warning("Error reading %s: %s", file_path, e)
             return []
         except (KeyError, TypeError, ValueError) as e:
-            print(f"Unexpected error reading {file_path}: {str(e)}")
+            logger.warning(
+                "Unexpected error reading %s: %s", file_path, e)
             return []
 
     def _write_json_file(
             self,
             file_path: str,
-            data: List[Dict[str, Any]]) -> bool:
+            data: List[Dict[str, Any]],
+            durable: bool = False) -> bool:
         """Write a list of dictionaries to a JSON file.
 
-        Returns True on success, False on error.
+        Returns True on success, False on error. The data is written
+        to a temporary file and moved into place with os.replace, so an
+        interrupted write never leaves a truncated JSON file behind.
+        `durable` additionally fsyncs before the replace; it is only
+        set on explicit flush() so routine writes stay cheap.
         """
+        tmp_path = file_path + '.tmp'
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                # orjson emits bytes directly, skipping the Python-level
+                # string encode
+                option = orjson.OPT_INDENT_2 if self.pretty else 0
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=option))
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    if self.pretty:
+                        json.dump(data, f, indent=2)
+                    else:
+                        json.dump(data, f, separators=(',', ':'))
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+            # Seed the parse cache with the just-written records so the
+            # next read skips the file entirely
+            self._read_cache[file_path] = (
+                os.stat(file_path).st_mtime_ns, data)
             return True
-        except (KeyError, TypeError, ValueError) as e:
-            print(f"Error writing {file_path}: {str(e)}")
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            logger.warning("Error writing %s: %s", file_path, e)
             return False
 
-    # Hotel operations
-    def create_hotel(self, hotel: Hotel) -> bool:
-        """Persist a new hotel if it does not already exist.
+    def _flush(self, kind: str, durable: bool = False) -> bool:
+        """Compact one entity kind (deferred in batch mode).
+
+        Rewrites the snapshot file from the in-memory index and drops
+        the journal, whose entries are now folded into the snapshot.
+        """
+        table = self._tables[kind]
+        if self._batch:
+            table.dirty = True
+            return True
+        with table.lock:
+            table.dirty = False
+            if not self._write_json_file(
+                    table.file_path, list(self._index(kind).values()),
+                    durable=durable):
+                return False
+            try:
+                os.remove(table.journal_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(
+                    "Error removing %s: %s", table.journal_path, e)
+                return False
+            return True
+
+    def flush(self) -> bool:
+        """Compact all three entity kinds to their snapshot files.
+
+        Explicit flushes also fsync so the snapshots survive power
+        loss. Returns True if every file was successfully written.
+        """
+        result = True
+        for kind in self._tables:
+            result = self._flush(kind, durable=True) and result
+        return result
+
+    def compact(self) -> bool:
+        """Fold all journalled mutations into the snapshot files."""
+        return self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator['DataPersistence']:
+        """Defer disk writes until the end of the block.
 
-        Validates the `Hotel` object, ensures the ID is unique and appends
-        the serialized hotel to the hotels JSON file.
+        Mutations inside the block only mark their index dirty; the
+        files touched are written once on exit, amortizing the JSON
+        encode and write cost over many operations.
         """
-        if not hotel.validate():
-            print("Error: Invalid hotel data")
+        self._batch = True
+        try:
+            yield self
+        finally:
+            self._batch = False
+            for kind, table in self._tables.items():
+                if table.dirty:
+                    self._flush(kind)
+
+    def __enter__(self) -> 'DataPersistence':
+        """Support use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush all pending state on exit."""
+        self.flush()
+
+    # Generic CRUD paths
+    def _create(self, kind: str, entity) -> bool:
+        """Persist a new entity if it validates and has a unique ID."""
+        table = self._tables[kind]
+        if not entity.validate():
+            logger.warning("Error: Invalid %s data", table.label.lower())
             return False
-        hotels = self._read_json_file(self.hotels_file)
-        for h in hotels:
-            if h.get('hotel_id') == hotel.hotel_id:
-                print(
-                    f"Error: Hotel with ID {hotel.hotel_id} "
-                    "already exists"
-                )
+        entity_id = getattr(entity, table.id_field)
+        with table.lock:
+            index = self._index(kind)
+            if entity_id in index:
+                logger.warning(
+                    "Error: %s with ID %s already exists",
+                    table.label, entity_id)
+                return False
+            # Journal first: a failed append must leave the in-memory
+            # state agreeing with both the return value and disk
+            data = entity.to_dict()
+            if not self._append_journal(kind, 'put', entity_id, data):
                 return False
-        hotels.append(hotel.to_dict())
-        return self._write_json_file(self.hotels_file, hotels)
+            index[entity_id] = data
+            table.obj_cache = None
+            if kind == 'reservations':
+                self._by_hotel[entity.hotel_id].append(entity_id)
+                self._by_customer[entity.customer_id].append(entity_id)
+            return True
 
-    def get_hotel(self, hotel_id: str) -> Optional[Hotel]:
-        """Retrieve a `Hotel` by its `hotel_id` or return None if not found."""
-        hotels = self._read_json_file(self.hotels_file)
-        for hotel_data in hotels:
-            if hotel_data.get('hotel_id') == hotel_id:
-                try:
-                    return Hotel.from_dict(hotel_data)
-                except (KeyError, TypeError, ValueError) as e:
-                    print(
-                        f"Error creating Hotel from data: {str(e)}"
-                    )
-                continue
+    def _create_many(self, kind: str, entities: List[Any]) -> List[bool]:
+        """Create several entities with a single snapshot write.
+
+        Each entity is validated and checked for uniqueness exactly as
+        in the singleton path; the per-entity results are returned in
+        order. The whole group shares one deferred disk write instead
+        of one journal append per record.
+        """
+        if self._batch:
+            return [self._create(kind, entity) for entity in entities]
+        with self.batch():
+            return [self._create(kind, entity) for entity in entities]
+
+    def _get(self, kind: str, entity_id: str):
+        """Retrieve one entity by ID, or None if not found."""
+        table = self._tables[kind]
+        if (table.index is None and ijson is not None
+                and not os.path.exists(table.journal_path)):
+            # Cold lookup with no pending journal: stream the snapshot
+            # and stop at the first match
+            data = self._stream_find(
+                table.file_path, table.id_field, entity_id)
+        else:
+            data = self._index(kind).get(entity_id)
+        if data is not None:
+            try:
+                return table.cls.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                # Lazy %-formatting: nothing is built unless a handler
+                # at WARNING level is attached
+                logger.warning(
+                    "Error creating %s from data: %s", table.label, e)
         return None
 
-    def get_all_hotels(self) -> List[Hotel]:
-        """Return all valid `Hotel` instances stored in the hotels file."""
-        hotels = self._read_json_file(self.hotels_file)
-        hotel_list: List[Hotel] = []
-        for hotel_data in hotels:
+    def _get_all(self, kind: str) -> List[Any]:
+        """Return all entities of one kind.
+
+        Records were validated when inserted, so reads trust that
+        invariant unless `validate_on_read` was requested. The
+        constructed list is cached until the next mutation of this
+        kind, so repeated reads return without any from_dict work.
+        """
+        table = self._tables[kind]
+        if table.obj_cache is not None:
+            return list(table.obj_cache)
+        entities: List[Any] = []
+        for data in self._index(kind).values():
             try:
-                hotel = Hotel.from_dict(hotel_data)
-                if hotel.validate():
-                    hotel_list.append(hotel)
+                entity = table.cls.from_dict(data)
+                if not self.validate_on_read or entity.validate():
+                    entities.append(entity)
             except (KeyError, TypeError, ValueError) as e:
-                print(
-                    f"Error creating Hotel from data: {str(e)}"
-                )
+                logger.warning(
+                    "Error creating %s from data: %s", table.label, e)
                 continue
-        return hotel_list
+        table.obj_cache = entities
+        return list(entities)
+
+    def _update(self, kind: str, entity_id: str, entity) -> bool:
+        """Replace the stored data for `entity_id`. Returns True if ok."""
+        table = self._tables[kind]
+        if not entity.validate():
+            logger.warning("Error: Invalid %s data", table.label.lower())
+            return False
+        with table.lock:
+            index = self._index(kind)
+            old = index.get(entity_id)
+            if old is None:
+                logger.warning(
+                    "Error: %s with ID %s not found",
+                    table.label, entity_id)
+                return False
+            # Journal first so a failed append leaves nothing mutated
+            data = entity.to_dict()
+            if not self._append_journal(kind, 'put', entity_id, data):
+                return False
+            if kind == 'reservations':
+                if old.get('hotel_id') != entity.hotel_id:
+                    self._by_hotel[old.get('hotel_id')].remove(entity_id)
+                    self._by_hotel[entity.hotel_id].append(entity_id)
+                if old.get('customer_id') != entity.customer_id:
+                    self._by_customer[old.get('customer_id')].remove(
+                        entity_id)
+                    self._by_customer[entity.customer_id].append(entity_id)
+            index[entity_id] = data
+            table.obj_cache = None
+            return True
+
+    def _delete(self, kind: str, entity_id: str) -> bool:
+        """Delete an entity by ID. Returns True if deletion occurred."""
+        table = self._tables[kind]
+        with table.lock:
+            index = self._index(kind)
+            removed = index.get(entity_id)
+            if removed is None:
+                logger.warning(
+                    "Error: %s with ID %s not found",
+                    table.label, entity_id)
+                return False
+            # Journal first so a failed append leaves nothing mutated
+            if not self._append_journal(kind, 'del', entity_id):
+                return False
+            del index[entity_id]
+            table.obj_cache = None
+            if kind == 'reservations':
+                self._by_hotel[removed.get('hotel_id')].remove(entity_id)
+                self._by_customer[removed.get('customer_id')].remove(
+                    entity_id)
+            return True
+
+    # Hotel operations
+    def create_hotel(self, hotel: Hotel) -> bool:
+        """Persist a new hotel if it does not already exist."""
+        return self._create('hotels', hotel)
+
+    def create_hotels(self, hotels: List[Hotel]) -> List[bool]:
+        """Persist many hotels with one disk write. Returns per-item results."""
+        return self._create_many('hotels', hotels)
+
+    def get_hotel(self, hotel_id: str) -> Optional[Hotel]:
+        """Retrieve a `Hotel` by its `hotel_id` or return None if not found."""
+        return self._get('hotels', hotel_id)
+
+    def get_all_hotels(self) -> List[Hotel]:
+        """Return all `Hotel` instances stored in the hotels file."""
+        return self._get_all('hotels')
 
     def update_hotel(self, hotel_id: str, hotel: Hotel) -> bool:
         """Replace the stored hotel data for `hotel_id` with the provided
         `Hotel` instance. Returns True on success.
         """
-        if not hotel.validate():
-            print("Error: Invalid hotel data")
-            return False
-        hotels = self._read_json_file(self.hotels_file)
-        for i, h in enumerate(hotels):
-            if h.get('hotel_id') == hotel_id:
-                hotels[i] = hotel.to_dict()
-                return self._write_json_file(self.hotels_file, hotels)
-        print(f"Error: Hotel with ID {hotel_id} not found")
-        return False
+        return self._update('hotels', hotel_id, hotel)
 
     def delete_hotel(self, hotel_id: str) -> bool:
         """Delete a hotel by `hotel_id`. Returns True if deletion occurred."""
-        hotels = self._read_json_file(self.hotels_file)
-        initial_length = len(hotels)
-        hotels = [h for h in hotels if h.get('hotel_id') != hotel_id]
-        if len(hotels) < initial_length:
-            return self._write_json_file(self.hotels_file, hotels)
-        print(f"Error: Hotel with ID {hotel_id} not found")
-        return False
+        return self._delete('hotels', hotel_id)
 
     # Customer operations
     def create_customer(self, customer: Customer) -> bool:
         """Persist a new customer if the ID is unique and data validates."""
-        if not customer.validate():
-            print("Error: Invalid customer data")
-            return False
-        customers = self._read_json_file(self.customers_file)
-        for c in customers:
-            if c.get('customer_id') == customer.customer_id:
-                print(
-                    f"Error: Customer with ID {customer.customer_id} "
-                    "already exists"
-                )
-                return False
-        customers.append(customer.to_dict())
-        return self._write_json_file(self.customers_file, customers)
+        return self._create('customers', customer)
+
+    def create_customers(self, customers: List[Customer]) -> List[bool]:
+        """Persist many customers with one disk write.
+
+        Returns per-item results.
+        """
+        return self._create_many('customers', customers)
 
     def get_customer(self, customer_id: str) -> Optional[Customer]:
         """Retrieve a `Customer` by `customer_id`, or None if not found."""
-        customers = self._read_json_file(self.customers_file)
-        for customer_data in customers:
-            if customer_data.get('customer_id') == customer_id:
-                try:
-                    return Customer.from_dict(customer_data)
-                except (KeyError, TypeError, ValueError) as e:
-                    print(
-                        f"Error creating Customer from data: {str(e)}"
-                    )
-                    continue
-        return None
+        return self._get('customers', customer_id)
 
     def get_all_customers(self) -> List[Customer]:
-        """Return all valid `Customer` instances stored in customers file."""
-        customers = self._read_json_file(self.customers_file)
-        customer_list: List[Customer] = []
-        for customer_data in customers:
-            try:
-                customer = Customer.from_dict(customer_data)
-                if customer.validate():
-                    customer_list.append(customer)
-            except (KeyError, TypeError, ValueError) as e:
-                print(
-                    f"Error creating Customer from data: {str(e)}"
-                )
-                continue
-        return customer_list
+        """Return all `Customer` instances stored in customers file."""
+        return self._get_all('customers')
 
     def update_customer(self, customer_id: str, customer: Customer) -> bool:
         """Update the stored customer data for `customer_id`.
 
         Returns True on success.
         """
-        if not customer.validate():
-            print("Error: Invalid customer data")
-            return False
-        customers = self._read_json_file(self.customers_file)
-        for i, c in enumerate(customers):
-            if c.get('customer_id') == customer_id:
-                customers[i] = customer.to_dict()
-                return self._write_json_file(self.customers_file, customers)
-        print(f"Error: Customer with ID {customer_id} not found")
-        return False
+        return self._update('customers', customer_id, customer)
 
     def delete_customer(self, customer_id: str) -> bool:
         """Delete a customer by `customer_id`. Returns True if deleted."""
-        customers = self._read_json_file(self.customers_file)
-        initial_length = len(customers)
-        customers = [
-            c for c in customers
-            if c.get('customer_id') != customer_id
-        ]
-        if len(customers) < initial_length:
-            return self._write_json_file(self.customers_file, customers)
-        print(f"Error: Customer with ID {customer_id} not found")
-        return False
+        return self._delete('customers', customer_id)
 
     # Reservation operations
     def create_reservation(self, reservation: Reservation) -> bool:
         """Persist a reservation if it validates and has a unique ID."""
-        if not reservation.validate():
-            print("Error: Invalid reservation data")
-            return False
-        reservations = self._read_json_file(self.reservations_file)
-        for r in reservations:
-            if r.get('reservation_id') == reservation.reservation_id:
-                print(
-                    f"Error: Reservation with ID {reservation.reservation_id} "
-                    "already exists"
-                )
-                return False
-        reservations.append(reservation.to_dict())
-        return self._write_json_file(self.reservations_file, reservations)
+        return self._create('reservations', reservation)
+
+    def create_reservations(
+            self, reservations: List[Reservation]) -> List[bool]:
+        """Persist many reservations with one disk write.
+
+        Returns per-item results.
+        """
+        return self._create_many('reservations', reservations)
 
     def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
         """Retrieve a `Reservation` by `reservation_id` if not found."""
-        reservations = self._read_json_file(self.reservations_file)
-        for res_data in reservations:
-            if res_data.get('reservation_id') == reservation_id:
-                try:
-                    return Reservation.from_dict(res_data)
-                except (KeyError, TypeError, ValueError) as e:
-                    print(
-                        f"Error creating Reservation from data: {str(e)}"
-                    )
-                    continue
-        return None
+        return self._get('reservations', reservation_id)
 
     def get_all_reservations(self) -> List[Reservation]:
-        """Return all valid `Reservation` instances stored in reservations."""
-        reservations = self._read_json_file(self.reservations_file)
-        res_list: List[Reservation] = []
-        for res_data in reservations:
-            try:
-                reservation = Reservation.from_dict(res_data)
-                if reservation.validate():
-                    res_list.append(reservation)
-            except (KeyError, TypeError, ValueError) as e:
-                print(
-                    f"Error creating Reservation from data: {str(e)}"
-                )
-                continue
-        return res_list
+        """Return all `Reservation` instances stored in reservations."""
+        return self._get_all('reservations')
+
+    def get_all_reservations_df(self) -> 'pd.DataFrame':
+        """Return all reservations as a DataFrame for bulk analytics.
+
+        Dates are parsed vectorially with pandas' C ISO8601 parser and
+        rows with unparseable or inverted date ranges are dropped, so
+        no per-row Python object or validate() call is needed.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError(
+                "pandas is required for get_all_reservations_df")
+        frame = pd.DataFrame.from_records(
+            list(self._index('reservations').values()))
+        if frame.empty:
+            return frame
+        frame['check_in'] = pd.to_datetime(
+            frame['check_in'], format='ISO8601', errors='coerce')
+        frame['check_out'] = pd.to_datetime(
+            frame['check_out'], format='ISO8601', errors='coerce')
+        return frame[frame['check_in'] < frame['check_out']]
 
     def update_reservation(
             self,
             reservation_id: str,
             reservation: Reservation) -> bool:
         """Update a reservation by ID. Returns True if ok."""
-        if not reservation.validate():
-            print("Error: Invalid reservation data")
-            return False
-        reservations = self._read_json_file(self.reservations_file)
-        for i, r in enumerate(reservations):
-            if r.get('reservation_id') == reservation_id:
-                reservations[i] = reservation.to_dict()
-                return self._write_json_file(
-                    self.reservations_file, reservations)
-        print(f"Error: Reservation with ID {reservation_id} not found")
-        return False
+        return self._update('reservations', reservation_id, reservation)
 
     def delete_reservation(self, reservation_id: str) -> bool:
         """Delete a reservation by `reservation_id`. Returns True if ok."""
-        reservations = self._read_json_file(self.reservations_file)
-        initial_length = len(reservations)
-        reservations = [
-            r for r in reservations
-            if r.get('reservation_id') != reservation_id
-        ]
-        if len(reservations) < initial_length:
-            return self._write_json_file(self.reservations_file, reservations)
-        print(f"Error: Reservation with ID {reservation_id} not found")
-        return False
+        return self._delete('reservations', reservation_id)
 
     def get_reservations_by_hotel(self, hotel_id: str) -> List[Reservation]:
         """Return active reservations for a specific hotel ID."""
-        reservations = self._read_json_file(self.reservations_file)
         res_list: List[Reservation] = []
-        for res_data in reservations:
-            if (
-                res_data.get('hotel_id') == hotel_id
-                and res_data.get('status') == 'active'
-            ):
+        reservations = self._index('reservations')
+        for res_id in self._by_hotel.get(hotel_id, ()):
+            res_data = reservations[res_id]
+            if res_data.get('status') == 'active':
                 try:
-                    reservation = Reservation.from_dict(res_data)
-                    if reservation.validate():
-                        res_list.append(reservation)
+                    res_list.append(Reservation.from_dict(res_data))
                 except (KeyError, TypeError, ValueError) as e:
-                    print(
-                        f"Error creating Reservation from data: {str(e)}"
-                    )
+                    logger.warning(
+                        "Error creating Reservation from data: %s", e)
                     continue
         return res_list
 
     def get_reservations_by_customer(
             self, customer_id: str) -> List[Reservation]:
         """Return all reservations for a given customer ID."""
-        reservations = self._read_json_file(self.reservations_file)
+        reservations = self._index('reservations')
         res_list: List[Reservation] = []
-        for res_data in reservations:
-            if res_data.get('customer_id') == customer_id:
-                try:
-                    reservation = Reservation.from_dict(res_data)
-                    if reservation.validate():
-                        res_list.append(reservation)
-                except (KeyError, TypeError, ValueError) as e:
-                    print(
-                        f"Error creating Reservation from data: {str(e)}"
-                    )
-                    continue
+        for res_id in self._by_customer.get(customer_id, ()):
+            try:
+                res_list.append(
+                    Reservation.from_dict(reservations[res_id]))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(
+                    "Error creating Reservation from data: %s", e)
+                continue
         return res_list
 
     def clear_all_data(self) -> bool:
@@ -357,7 +684,11 @@ class DataPersistence:
         Returns True if all files were successfully written as empty lists.
         """
         result = True
-        result = self._write_json_file(self.hotels_file, []) and result
-        result = self._write_json_file(self.customers_file, []) and result
-        result = self._write_json_file(self.reservations_file, []) and result
+        for kind, table in self._tables.items():
+            with table.lock:
+                table.index = {}
+                table.obj_cache = None
+                if kind == 'reservations':
+                    self._build_reservation_indexes(table.index)
+                result = self._flush(kind) and result
         return result
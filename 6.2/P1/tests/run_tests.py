@@ -14,9 +14,19 @@ if project_root not in sys.path:
 
 
 def main():
+    tests_dir = os.path.dirname(__file__)
+
+    # Prefer pytest-xdist when available: test classes run across
+    # worker processes, so filesystem-heavy tests overlap their I/O
+    try:
+        import pytest
+        import xdist  # noqa: F401  pylint: disable=unused-import
+        sys.exit(pytest.main([tests_dir, '-n', 'auto', '-q']))
+    except ImportError:
+        pass
+
     loader = unittest.TestLoader()
     # Discover tests in this tests/ directory
-    tests_dir = os.path.dirname(__file__)
     suite = loader.discover(start_dir=tests_dir, pattern='test_*.py')
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -162,3 +162,112 @@ class TestHotel(unittest.TestCase):
         self.assertIn("H001", str_repr)
         self.assertIn("Grand Hotel", str_repr)
 
+
+class TestDataPersistence(unittest.TestCase):
+    """Test cases for DataPersistence class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one persistence layer shared by all tests.
+
+        The directory and file creation cost is paid once here;
+        setUp only clears the in-memory state between tests.
+        """
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.persistence = DataPersistence(data_dir=cls.temp_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary data directory."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Reset stored data and build fresh test entities."""
+        self.persistence.clear_all_data()
+        self.hotel = Hotel("H001", "Grand Hotel", "New York", 100)
+        self.customer = Customer(
+            "C001", "John Doe", "john@example.com", "555-0100")
+        check_in = datetime.now() + timedelta(days=1)
+        check_out = check_in + timedelta(days=3)
+        self.reservation = Reservation(
+            "R001", "C001", "H001",
+            check_in.strftime('%Y-%m-%d'),
+            check_out.strftime('%Y-%m-%d'))
+
+    def test_create_and_get_hotel(self):
+        """Test creating a hotel and reading it back."""
+        self.assertTrue(self.persistence.create_hotel(self.hotel))
+        stored = self.persistence.get_hotel("H001")
+        self.assertIsNotNone(stored)
+        self.assertEqual(stored.name, "Grand Hotel")
+
+    def test_create_duplicate_hotel(self):
+        """Test that a duplicate hotel ID is rejected."""
+        self.assertTrue(self.persistence.create_hotel(self.hotel))
+        self.assertFalse(self.persistence.create_hotel(self.hotel))
+
+    def test_create_invalid_hotel(self):
+        """Test that invalid hotel data is rejected."""
+        self.hotel.name = ""
+        self.assertFalse(self.persistence.create_hotel(self.hotel))
+
+    def test_get_missing_hotel(self):
+        """Test that an unknown hotel ID returns None."""
+        self.assertIsNone(self.persistence.get_hotel("H999"))
+
+    def test_update_hotel(self):
+        """Test updating a stored hotel."""
+        self.persistence.create_hotel(self.hotel)
+        self.hotel.name = "Updated Grand Hotel"
+        self.assertTrue(self.persistence.update_hotel("H001", self.hotel))
+        self.assertEqual(
+            self.persistence.get_hotel("H001").name, "Updated Grand Hotel")
+
+    def test_delete_hotel(self):
+        """Test deleting a stored hotel."""
+        self.persistence.create_hotel(self.hotel)
+        self.assertTrue(self.persistence.delete_hotel("H001"))
+        self.assertIsNone(self.persistence.get_hotel("H001"))
+        self.assertFalse(self.persistence.delete_hotel("H001"))
+
+    def test_get_all_hotels(self):
+        """Test listing all stored hotels."""
+        self.persistence.create_hotel(self.hotel)
+        self.persistence.create_hotel(
+            Hotel("H002", "Hotel Paradise", "Miami", 50))
+        self.assertEqual(len(self.persistence.get_all_hotels()), 2)
+
+    def test_create_hotels_bulk(self):
+        """Test bulk hotel creation with per-item results."""
+        results = self.persistence.create_hotels([
+            Hotel("H002", "Hotel Paradise", "Miami", 50),
+            Hotel("H002", "Duplicate", "Miami", 50),
+        ])
+        self.assertEqual(results, [True, False])
+        self.assertEqual(len(self.persistence.get_all_hotels()), 1)
+
+    def test_create_and_get_customer(self):
+        """Test creating a customer and reading it back."""
+        self.assertTrue(self.persistence.create_customer(self.customer))
+        stored = self.persistence.get_customer("C001")
+        self.assertIsNotNone(stored)
+        self.assertEqual(stored.email, "john@example.com")
+
+    def test_reservation_queries(self):
+        """Test reservation lookups by hotel and by customer."""
+        self.persistence.create_hotel(self.hotel)
+        self.persistence.create_customer(self.customer)
+        self.assertTrue(
+            self.persistence.create_reservation(self.reservation))
+        by_hotel = self.persistence.get_reservations_by_hotel("H001")
+        self.assertEqual(len(by_hotel), 1)
+        self.assertEqual(by_hotel[0].reservation_id, "R001")
+        by_customer = self.persistence.get_reservations_by_customer("C001")
+        self.assertEqual(len(by_customer), 1)
+
+    def test_data_survives_reload(self):
+        """Test that stored data is visible to a fresh instance."""
+        self.persistence.create_hotel(self.hotel)
+        reloaded = DataPersistence(data_dir=self.temp_dir)
+        self.assertIsNotNone(reloaded.get_hotel("H001"))
+